@@ -5,6 +5,9 @@ from tempfile import gettempdir
 
 # Get the system's temporary directory path
 TEMP_DIR = gettempdir()
+# Prefixes of all paths within the temporary directory, as spelled by
+# gettempdir() and with symlinks resolved (e.g. /var -> /private/var on macOS)
+_TEMP_PREFIXES = (TEMP_DIR + os.sep, os.path.realpath(TEMP_DIR) + os.sep)
 
 def debug_log(msg):
     """
@@ -16,38 +19,103 @@ def debug_log(msg):
     if _PRINT_DEBUG_LOG:
         print(f"[DEBUG] {msg}")
 
-def _cleanup(path: Path) -> None | TypeError | ValueError | OSError:
+def _in_temp_dir(path: str) -> bool:
+    """
+    Checks whether a path is located within the temporary directory.
+
+    Args:
+        path (str): The path to check.
+
+    Returns:
+        bool: True if the path is absolute and within the temporary directory.
+
+    Note:
+        Only the parent directory is resolved with `os.path.realpath`, and only if
+        the plain prefix check fails. The last component is never followed, so a
+        symlink outside the temp directory pointing into it is rejected.
+    """
+    if not os.path.isabs(path):
+        # Relative paths would be looked up again against the cwd at deletion time
+        return False
+    if path.startswith(_TEMP_PREFIXES):
+        return True
+    return (os.path.realpath(os.path.dirname(path)) + os.sep).startswith(_TEMP_PREFIXES)
+
+
+def _cleanup(path: Path | str) -> None | TypeError | ValueError | OSError:
     """
     Cleans up (deletes) a file at the specified path, ensuring the path is valid and within the temporary directory.
 
     Args:
-        path (Path): The path of the file to be deleted.
+        path (Path | str): The path of the file to be deleted.
 
     Returns:
         None: If the file was successfully deleted.
-        TypeError: If the provided path is not of type `Path`.
+        TypeError: If the provided path is not of type `Path` or `str`.
         ValueError: If the path is empty or not within the temporary directory.
         OSError: If an error occurs during file deletion (e.g., file not found, permission error).
 
     Note:
         This function does not raise exceptions; it returns the exception instance if an error occurs.
     """
-    if not isinstance(path, Path):
-        # Only Path objects are allowed
-        return TypeError(f"path must be type Path: is {type(path)}")
-    if path == Path(""):
-        # Empty path "." is not allowed
+    # Work on the plain string, checks are simple string operations
+    s = os.fspath(path) if isinstance(path, Path) else path
+    if not isinstance(s, str):
+        # Only Path and str objects are allowed
+        return TypeError(f"path must be type Path or str: is {type(path)}")
+    if not s or s == ".":
+        # Empty path is not allowed (Path("") is ".")
         return ValueError(f"path cannot be empty")
-    if not path.is_relative_to(TEMP_DIR):
+    if not _in_temp_dir(s):
         # Path must be within the temporary directory
         return ValueError(f"path is not in temp directory: {path}")
+    return _cleanup_fast(s)
+
+
+def _cleanup_fast(path: str) -> None | OSError:
+    """
+    Deletes a file without validating the path first.
+
+    Only for trusted callers, e.g. the cleanup classes, which validated the path
+    with `check_path` when they were created.
+
+    Args:
+        path (str): The path of the file to be deleted.
+
+    Returns:
+        None: If the file was successfully deleted.
+        OSError: If an error occurs during file deletion (e.g., file not found, permission error).
+
+    Note:
+        This function does not raise exceptions; it returns the exception instance if an error occurs.
+    """
+    # No os.path.lexists pre-check: it catches an OSError from lstat itself, so a
+    # missing file costs the same, and an existing file costs an extra syscall
     try:
         # Attempt to delete the file
-        os.remove(path)
+        os.unlink(path)
         return None  # None indicates no error occurred
-    except (TypeError,  # Already captured by the TypeError check above
-            IsADirectoryError,  # Raised if the path is a directory
-            PermissionError,  # Raised if the file cannot be accessed
-            FileNotFoundError,  # Raised if the file does not exist
-            OSError) as exc:  # General OS-related errors
+    except OSError as exc:
+        # Covers IsADirectoryError, PermissionError, FileNotFoundError, ...
+        # TypeError cannot occur: callers pass validated str paths
         return exc
+
+
+# os.unlink is bound as a default for a local lookup in the loop
+def _unlink_batch(paths: list[str], _unlink=os.unlink) -> None:
+    """
+    Deletes a batch of already validated files in one pass, ignoring errors.
+
+    Args:
+        paths (list[str]): The paths of the files to be deleted.
+
+    Note:
+        The files are deleted sequentially. They share the temp directory, so
+        the unlink calls serialize on its lock anyway, and threads cannot be
+        started inside atexit handlers on recent Python versions.
+    """
+    for path in paths:
+        try:
+            _unlink(path)
+        except OSError:
+            pass
@@ -9,7 +9,6 @@ from sys import modules
 from pathlib import Path
 import os
 from threading import Lock
-import weakref
 
 USE_ATEXIT = True
 
@@ -18,6 +17,7 @@ if USE_ATEXIT:
 else:
     from weakref import finalize
 
+# (fd, st_dev, st_ino): the file identity tells a reused fd number apart at exit
 _fd_list = list()
 _file_list = list()
 _lock = Lock()
@@ -34,11 +34,11 @@ def register_fd(fd: int) -> bool:
         True if registration was successful, False otherwise.
     """
     try:
-        os.fstat(fd)
+        st = os.fstat(fd)
     except OSError:
         return False
     with _lock:
-        _fd_list.append(fd)
+        _fd_list.append((fd, st.st_dev, st.st_ino))
     return True
 
 
@@ -73,10 +73,31 @@ def register_tempfile(fd: int, path: Path | str) -> bool:
     result_file = register_file(path)
     return result_fd and result_file
 
-def _cleanup_tempfiles():
+
+def _register_tempfile_trusted(fd: int, path: Path | str) -> None:
+    """
+    Register a file descriptor and path for cleanup at exit without validating the path.
+
+    Only for trusted callers that just created the file, e.g. `atexit_mkstemp`.
+
+    Args:
+        fd: The file descriptor to close.
+        path: The file path to remove.
+    """
+    st = os.fstat(fd)
+    with _lock:
+        _fd_list.append((fd, st.st_dev, st.st_ino))
+        _file_list.append(path)
+
+# os functions are bound as defaults for local lookups in the loops
+def _cleanup_tempfiles(_fstat=os.fstat, _close=os.close, _remove=os.remove):
     """
     Close all registered file descriptors and remove all registered files.
     This function is registered to be called at program exit.
+
+    A file descriptor is only closed if it still refers to the registered file:
+    callers may have closed it themselves, and the number may since have been
+    reused for another file.
     """
     with _lock:
         # It's safer to work on copies of the lists
@@ -85,12 +106,34 @@ def _cleanup_tempfiles():
         _fd_list.clear()
         _file_list.clear()
 
-    for fd in fds_to_close:
+    for fd, dev, ino in fds_to_close:
         try:
-            os.close(fd)
+            st = _fstat(fd)
+            if st.st_dev == dev and st.st_ino == ino:
+                _close(fd)
         except OSError:
             pass
     for path in paths_to_remove:
+        try:
+            _remove(path)
+        except OSError:
+            pass
+
+
+def _close_and_remove(fd: int | None, path: Path | str | None) -> None:
+    """
+    Close a file descriptor and remove a file path, ignoring errors.
+
+    Args:
+        fd: The file descriptor to close, or None.
+        path: The file path to remove, or None.
+    """
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    if path is not None:
         try:
             os.remove(path)
         except OSError:
@@ -100,65 +143,46 @@ def _cleanup_tempfiles():
 class TempfileCleaner:
     """
     Class to manage cleanup of temporary files and file descriptors for all instances.
+
+    Instances record their file descriptor and path in a class-level registry.
+    At program exit, everything still registered is closed and removed in a
+    single pass, without dispatching to the instances.
     """
-    _instances = []
+    _registry = dict()
 
     def __init__(self, fd: int = None, path: Path | str = None):
         self.fd = fd
         self.path = path
-        # Add a weak reference to this instance
-        self_ref = weakref.ref(self, self._remove_dead_ref)
-        TempfileCleaner._instances.append(self_ref)
+        TempfileCleaner._registry[id(self)] = (fd, path)
 
     def cleanup(self):
         """
         Cleanup the file descriptor and/or file path for this instance.
         """
-        if self.fd is not None:
-            try:
-                os.close(self.fd)
-            except OSError:
-                pass
-            self.fd = None
-        if self.path is not None:
-            try:
-                os.remove(self.path)
-            except OSError:
-                pass
-            self.path = None
+        TempfileCleaner._registry.pop(id(self), None)
+        _close_and_remove(self.fd, self.path)
+        self.fd = None
+        self.path = None
 
     @classmethod
     def _atexit(cls):
         """
         Classmethod to cleanup all living instances at program exit.
         """
-        for ref in cls._instances:
-            inst = ref()
-            if inst is not None:
-                inst._on_finalize()
-        cls._instances.clear()
-
-    @classmethod
-    def _remove_dead_ref(cls, ref):
-        """
-        Remove dead weak references from the _instances list.
-        """
-        try:
-            cls._instances.remove(ref)
-        except ValueError:
-            pass
+        registry = cls._registry
+        while registry:
+            fd, path = registry.popitem()[1]
+            _close_and_remove(fd, path)
 
     def __del__(self):
-        # Remove this instance's weakref from the list if it's being deleted
-        # (handled by weakref callback, but __del__ is a fallback)
-        for ref in list(self._instances):
-            if ref() is self:
-                self._instances.remove(ref)
-                break
-
-# Register the classmethod with atexit
+        # Only living instances are cleaned up at exit:
+        # drop this instance's entry when it is being deleted
+        TempfileCleaner._registry.pop(id(self), None)
+
+# Register the classmethod and the module-level lists with atexit
 if USE_ATEXIT:
     register(TempfileCleaner._atexit)
+    register(_cleanup_tempfiles)
 else:
     # Using finalize on the module object for cleanup at shutdown
     this_module = modules[__name__]
@@ -1,5 +1,6 @@
 from tempfile import mkstemp
-from .atexit_cleanup import register_tempfile
+import os
+from .atexit_cleanup import _register_tempfile_trusted
 
 SUFFIX = ".atexit"  # default tempfile suffix
 PREFIX = "atexit_"  # default tempfile prefix
@@ -28,7 +29,8 @@ def atexit_mkstemp(
             absolute path of the created temporary file.
         """
     fd, filename = mkstemp(suffix=suffix, prefix=prefix, dir=dir, text=text)
-    register_tempfile(fd, filename)
+    # mkstemp just created the file, no need to stat it again
+    _register_tempfile_trusted(fd, filename)
     return fd, filename
 
 def atexit_write_tempfile(
@@ -42,8 +44,16 @@ def atexit_write_tempfile(
         with open(filename, "w") as f:
             f.write(temp_data)
     elif isinstance(temp_data, bytes) and not text:
-        with open(filename, "wb") as f:
-            f.write(temp_data)
+        if hasattr(os, "pwrite"):
+            # Write through the existing fd, no second open and no buffer copy;
+            # pwrite leaves the fd's offset at the start of the file
+            view = memoryview(temp_data)
+            written = 0
+            while written < len(view):
+                written += os.pwrite(fd, view[written:], written)
+        else:
+            with open(filename, "wb") as f:
+                f.write(temp_data)
     else:
         raise ValueError("temp_data must be str if text is True, bytes if text is False")
     return fd, filename
\ No newline at end of file
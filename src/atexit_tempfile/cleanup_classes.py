@@ -1,32 +1,28 @@
 """
 This module provides classes and utilities for managing temporary file cleanup
-using different strategies, such as `__del__` and `weakref.finalize`. It also
+using different strategies, such as `__del__` and a shared registry. It also
 integrates with `atexit` to ensure cleanup at interpreter shutdown.
 
 Classes:
-    - Cleanup: Abstract base class for cleanup implementations.
+    - Cleanup: Base class for cleanup implementations.
     - CleanupWithDel: Cleanup implementation using `__del__`.
-    - CleanupWithFinalize: Cleanup implementation using `weakref.finalize`.
+    - CleanupWithFinalize: Cleanup implementation using a registry drained at exit.
 
 Functions:
     - check_path: Validates a given path to ensure it is a file within the temp directory.
-    - _on_finalize: Finalizer function to clean up delayed objects.
-    - _at_exit: Atexit handler to trigger finalization.
+    - _at_exit: Atexit handler to clean up delayed and surviving objects.
 
 Constants:
     - TEMP_DIR: The system's temporary directory path.
 """
 
-from ._cleanup_module import _cleanup
-from tempfile import gettempdir
+from ._cleanup_module import TEMP_DIR, _cleanup_fast, _in_temp_dir, _unlink_batch
 from pathlib import Path
-from weakref import finalize
 from atexit import register
-from abc import ABC, abstractmethod
-from sys import modules
-
-# The system's temporary directory path
-TEMP_DIR = gettempdir()
+from stat import S_ISREG
+from textwrap import indent
+import linecache
+import os
 
 
 def check_path(path: Path | str):
@@ -41,37 +37,39 @@ def check_path(path: Path | str):
         path (Path | str): The path to validate.
 
     Returns:
-        Path: The validated Path object.
+        Path: The validated Path object (the given object if it is already a Path).
 
     Raises:
         ValueError: If the path is empty or not a file.
         TypeError: If the path is not a string or Path object.
         FileNotFoundError: If the path does not exist.
     """
-    if path is None or path == "" or path == Path(""):
+    if path is None:
         raise ValueError("path cannot be empty")
-    if not isinstance(path, str) and not isinstance(path, Path):
+    if isinstance(path, Path):
+        s = os.fspath(path)
+    elif isinstance(path, str):
+        s = path
+    else:
         raise TypeError("path must be a string or Path")
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Path does not exist: {path}")
-    if not path.is_file():
+    if not s or s == ".":  # Path("") is "."
+        raise ValueError("path cannot be empty")
+    # All checks work on the plain string, no intermediate Path objects
+    try:
+        st = os.stat(s)  # single stat call for existence and file type
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Path does not exist: {path}") from None
+    if not S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {path}")
-    if not path.is_relative_to(TEMP_DIR):
+    if not _in_temp_dir(s):
         raise ValueError(f"Path is not in temp directory: {path}")
-    return path
-
-
-class Cleanup(ABC):
-    """
-    Abstract base class for cleanup implementations.
-
-    Attributes:
-        _delay_till_exit (list): Class-level list to store objects for delayed cleanup.
-    """
+    return path if isinstance(path, Path) else Path(s)
 
-    _delay_till_exit = list()
 
+# Source of the __init__ generated for every Cleanup subclass.
+# {init_src} is replaced by the subclass's _INIT_SRC.
+_INIT_TEMPLATE = '''
+def _make_init(_delay_till_exit):
     def __init__(self, path: Path | str, delay_till_exit: bool = False):
         """
         Initializes the Cleanup object.
@@ -83,19 +81,75 @@ class Cleanup(ABC):
         Raises:
             ValueError, TypeError, FileNotFoundError: If the path is invalid.
         """
-        self._initialized = False
         self._path = check_path(path)  # raises exceptions on errors
         if delay_till_exit:
-            Cleanup._delay_till_exit.append(self)
-        self._init()
+            _delay_till_exit[id(self)] = (self, os.fspath(self._path))
+{init_src}
         self._initialized = True  # safeguard for partially initialized instances
+    return __init__
+'''
+
+
+class Cleanup:
+    """
+    Base class for cleanup implementations.
 
-    @abstractmethod
-    def _init(self):
+    Subclasses provide their initialization code as source in `_INIT_SRC`,
+    which is inlined into a generated `__init__` when the subclass is created.
+
+    Attributes:
+        _delay_till_exit (dict): Class-level dict mapping id(object) to (object, path string)
+            for delayed cleanup. The entry keeps the object alive until exit or explicit cleanup.
+        _INIT_SRC (str): Subclass-specific statements run at the end of `__init__`.
+    """
+
+    # __weakref__ keeps instances weak-referenceable, as they were without slots
+    __slots__ = ("_path", "_initialized", "__weakref__")
+
+    _delay_till_exit = dict()
+    _INIT_SRC = "pass"
+
+    def __new__(cls, *args, **kwargs):
         """
-        Abstract method for initialization logic in subclasses.
+        Creates the object with `_initialized` already set to False, so `__del__`
+        can rely on it even if `__init__` fails.
+
+        Raises:
+            TypeError: If the base class itself is instantiated.
         """
-        pass
+        if cls is Cleanup:
+            # Only subclasses get a generated __init__
+            raise TypeError("Cleanup is a base class, use CleanupWithDel or CleanupWithFinalize")
+        self = super().__new__(cls)
+        self._initialized = False
+        return self
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Generates a specialized `__init__` for subclasses defining `_INIT_SRC`.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_INIT_SRC" not in cls.__dict__:
+            return  # inherit the __init__ of the parent class
+        namespace = {}
+        source = _INIT_TEMPLATE.format(init_src=indent(cls._INIT_SRC, " " * 8))
+        filename = f"<{cls.__qualname__} generated>"
+        # Make the generated source available to tracebacks
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        exec(compile(source, filename, "exec"), globals(), namespace)
+        init = namespace["_make_init"](Cleanup._delay_till_exit)
+        init.__qualname__ = f"{cls.__qualname__}.__init__"
+        cls.__init__ = init
+
+    def _detach(self) -> bool:
+        """
+        Marks the object as cleaned up without deleting the file.
+        Must be implemented by subclasses.
+
+        Returns:
+            bool: True if the cleanup was still pending.
+        """
+        raise NotImplementedError
 
     @property
     def path(self):
@@ -116,13 +170,20 @@ class CleanupWithDel(Cleanup):
         _cleaned_up (bool): Tracks whether cleanup has been performed.
     """
 
-    _cleaned_up = None
+    __slots__ = ("_cleaned_up",)
+
+    _INIT_SRC = "self._cleaned_up = False"
 
-    def _init(self):
+    def _detach(self) -> bool:
         """
-        Initializes the CleanupWithDel object.
+        Marks the object as cleaned up without deleting the file.
+
+        Returns:
+            bool: True if the cleanup was still pending.
         """
-        self._cleaned_up = False
+        pending = not self._cleaned_up
+        self._cleaned_up = True
+        return pending
 
     def cleanup(self) -> Exception | None:
         """
@@ -134,7 +195,8 @@ class CleanupWithDel(Cleanup):
         if not self._cleaned_up:
             # This may run during interpreter shutdown
             # --> avoid raising new exceptions
-            exc = _cleanup(self.path)
+            Cleanup._delay_till_exit.pop(id(self), None)
+            exc = _cleanup_fast(os.fspath(self._path))
             self._cleaned_up = True
             return exc
         return None
@@ -143,7 +205,11 @@ class CleanupWithDel(Cleanup):
         """
         Destructor method to ensure cleanup is performed.
         """
-        if not hasattr(self, "_initialized") or not self._initialized:
+        try:
+            initialized = self._initialized  # set by __new__
+        except AttributeError:
+            return  # object created without Cleanup.__new__ (e.g., object.__new__)
+        if not initialized:
             # __del__ may be called when __init__ fails (e.g., raises exception)
             return  # safeguard for partially initialized instances
         self.cleanup()
@@ -152,49 +218,76 @@ class CleanupWithDel(Cleanup):
 
 class CleanupWithFinalize(Cleanup):
     """
-    Cleanup implementation using `weakref.finalize` for cleanup.
+    Cleanup implementation using a class-level registry for cleanup.
+
+    Each object registers its path when created and removes it again when
+    cleaned up or garbage collected. Paths still registered at interpreter
+    shutdown are deleted by the atexit handler, so no per-object
+    `weakref.finalize` is needed.
 
     Attributes:
-        _finalizer (weakref.finalize): Finalizer object for cleanup.
+        _registry (dict): Class-level dict mapping id(object) to the path string
+            of every object that still needs cleanup.
     """
 
-    _finalizer = None
+    __slots__ = ()
+
+    _registry = dict()
+    _INIT_SRC = "CleanupWithFinalize._registry[id(self)] = os.fspath(self._path)"
 
-    def _init(self):
+    def _detach(self) -> bool:
         """
-        Initializes the CleanupWithFinalize object and sets up the finalizer.
+        Removes the object from the registry without deleting the file.
+
+        Returns:
+            bool: True if the cleanup was still pending.
         """
-        self._finalizer = finalize(self, _cleanup, self.path)
+        return CleanupWithFinalize._registry.pop(id(self), None) is not None
 
     def cleanup(self) -> Exception | None:
         """
-        Performs cleanup by invoking the finalizer.
+        Performs cleanup if it has not already been done.
 
         Returns:
             Exception | None: The exception raised during cleanup, if any.
         """
-        # Finalizer avoids double cleanup
+        # Registry avoids double cleanup
         # No extra cleaned_up flag needed
-        return self._finalizer.__call__()
+        key = id(self)
+        path = CleanupWithFinalize._registry.pop(key, None)
+        if path is None:
+            return None  # already cleaned up, also no longer delayed
+        Cleanup._delay_till_exit.pop(key, None)
+        return _cleanup_fast(path)
 
-
-def _on_finalize(*args, **kwargs):
-    """
-    Finalizer function to clean up objects marked for delayed cleanup.
-    """
-    delay_till_exit = Cleanup._delay_till_exit
-    for ret in list(delay_till_exit):
-        ret.cleanup()
-    delay_till_exit.clear()
-
-
-# Register a finalizer for the module to clean up delayed objects
-finalize(modules[__name__], _on_finalize)
+    def __del__(self):
+        """
+        Destructor method to ensure cleanup is performed.
+        """
+        # Partially initialized instances are not in the registry
+        self.cleanup()
 
 
 @register
 def _at_exit(*args, **kwargs):
     """
-    Atexit handler to trigger finalization at interpreter shutdown.
+    Atexit handler to clean up objects marked for delayed cleanup and
+    CleanupWithFinalize objects still alive at interpreter shutdown.
+
+    The objects are only marked as cleaned up; their files are validated with a
+    string prefix check and deleted together in one batch.
     """
-    _on_finalize(*args, **kwargs)
+    delayed = Cleanup._delay_till_exit
+    registry = CleanupWithFinalize._registry
+    paths = []
+    # Pop instead of iterating: entries are released one by one, and objects
+    # dropped here may run __del__, which touches both dicts
+    while delayed:
+        obj, path = delayed.popitem()[1]
+        if obj._detach() and _in_temp_dir(path):
+            paths.append(path)
+    while registry:
+        path = registry.popitem()[1]
+        if _in_temp_dir(path):
+            paths.append(path)
+    _unlink_batch(paths)
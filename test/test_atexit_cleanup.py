@@ -0,0 +1,110 @@
+import unittest
+from pathlib import Path
+import tempfile
+import os
+
+from atexit_tempfile.atexit_cleanup import TempfileCleaner
+
+class TestTempfileCleaner(unittest.TestCase):
+
+    def setUp(self):
+        self.fd, filename = tempfile.mkstemp()
+        self.temp_file_path = Path(filename)
+
+    def tearDown(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+        if self.temp_file_path.exists():
+            os.unlink(self.temp_file_path)
+
+    def test_cleanup_closes_and_removes(self):
+        obj = TempfileCleaner(self.fd, self.temp_file_path)
+        obj.cleanup()
+        self.assertFalse(self.temp_file_path.exists())
+        with self.assertRaises(OSError):
+            os.fstat(self.fd)
+        self.assertIsNone(obj.fd)
+        self.assertIsNone(obj.path)
+
+    def test_registry(self):
+        obj = TempfileCleaner(self.fd, self.temp_file_path)
+        key = id(obj)
+        self.assertEqual(TempfileCleaner._registry[key], (self.fd, self.temp_file_path))
+        obj.cleanup()
+        self.assertNotIn(key, TempfileCleaner._registry)
+
+    def test_dead_instance_unregistered(self):
+        obj = TempfileCleaner(self.fd, self.temp_file_path)
+        key = id(obj)
+        del obj
+        self.assertNotIn(key, TempfileCleaner._registry)
+        # dead instances are not cleaned up
+        self.assertTrue(self.temp_file_path.exists())
+
+    def test_cleanup_twice_safe(self):
+        obj = TempfileCleaner(self.fd, self.temp_file_path)
+        obj.cleanup()
+        # Second call should not raise
+        obj.cleanup()
+
+    def test_cleanup_on_exit(self):
+        from textwrap import dedent
+        script = dedent(f"""
+                import sys
+                from src.atexit_tempfile.atexit_cleanup import TempfileCleaner
+
+                obj = TempfileCleaner(path=sys.argv[1])
+                """)
+        import subprocess
+        result = subprocess.run(
+            ["python", "-c", script, str(self.temp_file_path)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stderr, "")
+        self.assertFalse(self.temp_file_path.exists())
+
+    def test_registered_tempfile_removed_on_exit(self):
+        from textwrap import dedent
+        script = dedent(f"""
+                from src.atexit_tempfile import atexit_mkstemp
+
+                fd, filename = atexit_mkstemp()
+                print(filename)
+                """)
+        import subprocess
+        result = subprocess.run(
+            ["python", "-c", script],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stderr, "")
+        self.assertFalse(Path(result.stdout.strip()).exists())
+
+    def test_reused_fd_not_closed_on_exit(self):
+        # The caller closes the mkstemp fd and the number is reused by the next open
+        from textwrap import dedent
+        script = dedent(f"""
+                import os
+                import sys
+                from src.atexit_tempfile import atexit_mkstemp
+
+                fd, filename = atexit_mkstemp()
+                os.close(fd)
+                f = open(sys.argv[1], "w")
+                f.write("important data\\n")
+                """)
+        import subprocess
+        subprocess.run(
+            ["python", "-c", script, str(self.temp_file_path)],
+            check=True
+        )
+        self.assertEqual(self.temp_file_path.read_text(), "important data\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,10 +36,19 @@ class TestCheckPath(unittest.TestCase):
         result = check_path(self.temp_file_path)
         self.assertEqual(result, self.temp_file_path)
 
+    def test_valid_str_path(self):
+        result = check_path(str(self.temp_file_path))
+        self.assertIsInstance(result, Path)
+        self.assertEqual(result, self.temp_file_path)
+
     def test_empty_path(self):
         with self.assertRaises(ValueError):
             check_path("")
 
+    def test_empty_path_object(self):
+        with self.assertRaisesRegex(ValueError, "empty"):
+            check_path(Path(""))
+
     def test_none_path(self):
         with self.assertRaises(ValueError):
             check_path(None)
@@ -61,5 +70,35 @@ class TestCheckPath(unittest.TestCase):
         with self.assertRaises(ValueError):
             check_path(self.outside_file_path)
 
+    def test_path_through_symlink(self):
+        # Temp dir reached through a symlink outside of it, e.g. /var -> /private/var on macOS
+        link = test_temp_dir / "temp_dir_link"
+        os.symlink(TEMP_DIR, link)
+        try:
+            linked_path = link / self.temp_file_path.name
+            result = check_path(linked_path)
+            self.assertEqual(result, linked_path)
+        finally:
+            os.unlink(link)
+
+    def test_symlink_into_tempdir(self):
+        # Link outside TEMP_DIR pointing to a file inside is not in the temp dir
+        link = test_temp_dir / "temp_file_link"
+        os.symlink(self.temp_file_path, link)
+        try:
+            with self.assertRaises(ValueError):
+                check_path(link)
+        finally:
+            os.unlink(link)
+
+    def test_relative_path(self):
+        cwd = os.getcwd()
+        os.chdir(self.temp_file_path.parent)
+        try:
+            with self.assertRaises(ValueError):
+                check_path(self.temp_file_path.name)
+        finally:
+            os.chdir(cwd)
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
-from atexit_tempfile._cleanup_module import _cleanup
+from atexit_tempfile._cleanup_module import _cleanup, _unlink_batch
 from tempfile import gettempdir
 
 not_in_temp_dir = Path.home() / "not_in_temp_dir.tmp"
@@ -12,6 +12,10 @@ class TestCleanup(unittest.TestCase):
         exc = _cleanup(Path(""))
         self.assertIsInstance(exc, ValueError)
 
+    def test_empty_str_path(self):
+        exc = _cleanup("")
+        self.assertIsInstance(exc, ValueError)
+
     def test_nonexistent_file(self):
         nonexistent_file = Path(gettempdir()) / "nonexistent_file.tmp"
         exc = _cleanup(nonexistent_file)
@@ -39,9 +43,54 @@ class TestCleanup(unittest.TestCase):
         self.assertIsNone(exc)
         self.assertFalse(os.path.exists(path))
 
+    def test_successful_cleanup_str(self):
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            path = tmp.name
+
+        exc = _cleanup(path)
+        self.assertIsNone(exc)
+        self.assertFalse(os.path.exists(path))
+
+    def test_wrong_type(self):
+        exc = _cleanup(os.fsencode(Path(gettempdir()) / "wrong_type.tmp"))
+        self.assertIsInstance(exc, TypeError)
+
     def test_not_in_temp_dir(self):
         exc = _cleanup(not_in_temp_dir)
         self.assertIsInstance(exc, ValueError)
 
+    def test_symlink_into_temp_dir(self):
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            path = Path(tmp.name)
+        link = Path.home() / "link_into_temp_dir.tmp"
+        os.symlink(path, link)
+        try:
+            exc = _cleanup(link)
+            self.assertIsInstance(exc, ValueError)
+            self.assertTrue(os.path.lexists(link))
+        finally:
+            os.unlink(link)
+            os.unlink(path)
+
+    def test_relative_path(self):
+        cwd = os.getcwd()
+        os.chdir(gettempdir())
+        try:
+            exc = _cleanup("relative_file.tmp")
+            self.assertIsInstance(exc, ValueError)
+        finally:
+            os.chdir(cwd)
+
+    def test_unlink_batch(self):
+        paths = []
+        for _ in range(40):
+            with tempfile.NamedTemporaryFile(delete=False) as tmp:
+                paths.append(tmp.name)
+        # missing files are ignored
+        paths.append(str(Path(gettempdir()) / "nonexistent_file.tmp"))
+        _unlink_batch(paths)
+        for path in paths:
+            self.assertFalse(os.path.exists(path))
+
 if __name__ == "__main__":
     unittest.main()
@@ -23,6 +23,16 @@ class TestCleanupWithDel(unittest.TestCase):
         self.assertFalse(obj._cleaned_up)
         self.assertTrue(obj._initialized)
 
+    def test_no_instance_dict(self):
+        obj = CleanupWithDel(self.temp_file_path)
+        self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_weakref(self):
+        import weakref
+        obj = CleanupWithDel(self.temp_file_path)
+        ref = weakref.ref(obj)
+        self.assertIs(ref(), obj)
+
     def test_init_invalid_path(self):
         with self.assertRaises(ValueError):
             CleanupWithDel("")
@@ -56,6 +66,10 @@ class TestCleanupWithDel(unittest.TestCase):
             self.fail(f"__del__ raised exception: {e}")
         self.assertTrue(Path(self.temp_file_path).exists())
 
+    def test_new_sets_not_initialized(self):
+        obj = CleanupWithDel.__new__(CleanupWithDel)
+        self.assertFalse(obj._initialized)
+
     def test_blank_instance(self):
         # create a blank instance
         obj = object.__new__(CleanupWithDel)
@@ -138,6 +152,67 @@ class TestCleanupWithDel(unittest.TestCase):
         )
         self.assertFalse(self.temp_file_path.exists())
 
+    def test_user_atexit_runs_before_delayed_cleanup(self):
+        # atexit runs handlers last-registered-first: a handler registered after
+        # import must still see the delayed file
+        from textwrap import dedent
+        script = dedent(f"""
+                import sys
+                import atexit
+                from pathlib import Path
+                from src.atexit_tempfile.cleanup_classes import CleanupWithDel
+
+                temp_file = Path(sys.argv[1])
+
+                @atexit.register
+                def check_file():
+                    assert temp_file.exists(), "file deleted before user handler"
+
+                obj = CleanupWithDel(temp_file, delay_till_exit=True)
+                """)
+        import subprocess
+        result = subprocess.run(
+            ["python", "-c", script, str(self.temp_file_path)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertNotIn("AssertionError", result.stderr)
+        self.assertFalse(self.temp_file_path.exists())
+
+    def test_delayed_deleting_many(self):
+        from textwrap import dedent
+        temp_files = []
+        for _ in range(100):
+            with tempfile.NamedTemporaryFile(dir=TEMP_DIR, delete=False) as tmp:
+                temp_files.append(Path(tmp.name))
+        script = dedent(f"""
+                import sys
+                from pathlib import Path
+                from src.atexit_tempfile.cleanup_classes import CleanupWithDel
+
+                temp_files = [Path(arg) for arg in sys.argv[1:]]
+                def subroutine():
+                    for temp_file in temp_files:
+                        obj = CleanupWithDel(temp_file, delay_till_exit=True)
+                subroutine()
+                assert all(temp_file.exists() for temp_file in temp_files)
+                """)
+        import subprocess
+        try:
+            subprocess.run(
+                ["python", "-c", script] + [str(path) for path in temp_files],
+                check=True
+            )
+            # one directory read instead of a stat per file
+            present = {entry.name for entry in os.scandir(TEMP_DIR)}
+            for temp_file in temp_files:
+                self.assertNotIn(temp_file.name, present)
+        finally:
+            for temp_file in temp_files:
+                if temp_file.exists():
+                    os.unlink(temp_file)
+
 
     def test_run_example(self):
         import subprocess
@@ -4,7 +4,7 @@ from pathlib import Path
 import tempfile
 import os
 
-from src.atexit_tempfile.cleanup_classes import CleanupWithFinalize, TEMP_DIR
+from src.atexit_tempfile.cleanup_classes import Cleanup, CleanupWithFinalize, TEMP_DIR
 
 class TestCleanupWithFinalize(unittest.TestCase):
 
@@ -26,17 +26,41 @@ class TestCleanupWithFinalize(unittest.TestCase):
         with self.assertRaises(ValueError):
             CleanupWithFinalize("")
 
+    def test_base_class_not_instantiable(self):
+        with self.assertRaises(TypeError):
+            Cleanup(self.temp_file_path)
+        self.assertTrue(self.temp_file_path.exists())
+
+    def test_weakref(self):
+        import weakref
+        obj = CleanupWithFinalize(self.temp_file_path)
+        ref = weakref.ref(obj)
+        self.assertIs(ref(), obj)
+
     def test_cleanup_deletes_file(self):
         obj = CleanupWithFinalize(self.temp_file_path)
         obj.cleanup()
         self.assertFalse(self.temp_file_path.exists())
 
+    def test_cleanup_unregisters(self):
+        obj = CleanupWithFinalize(self.temp_file_path)
+        self.assertIn(id(obj), CleanupWithFinalize._registry)
+        obj.cleanup()
+        self.assertNotIn(id(obj), CleanupWithFinalize._registry)
+
     def test_cleanup_twice_safe(self):
         obj = CleanupWithFinalize(self.temp_file_path)
         obj.cleanup()
         # Second call should not raise
         obj.cleanup()
 
+    def test_cleanup_releases_delayed_object(self):
+        obj = CleanupWithFinalize(self.temp_file_path, delay_till_exit=True)
+        self.assertIn(id(obj), Cleanup._delay_till_exit)
+        obj.cleanup()
+        self.assertNotIn(id(obj), Cleanup._delay_till_exit)
+        self.assertFalse(self.temp_file_path.exists())
+
     def test_delete_file_on_del(self):
         obj = CleanupWithFinalize(self.temp_file_path)
         del obj
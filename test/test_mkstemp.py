@@ -18,16 +18,25 @@ def test_write_tempfile():
     with open(filename, "r") as f:
         assert f.read() == "Hello World!"
 
+def test_write_tempfile_bytes():
+    fd, filename = atexit_write_tempfile(b"Hello World!", text=False)
+    with open(filename, "rb") as f:
+        assert f.read() == b"Hello World!"
+    import os
+    assert os.lseek(fd, 0, os.SEEK_CUR) == 0
+
 def print_tempfiles():
     import tempfile
-    tempfile_dir = Path(tempfile.gettempdir())
-    for path in tempfile_dir.iterdir():
-        if path.name.startswith("atexit_") and path.name.endswith(".atexit"):
-            print(path)
+    import os
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if entry.name.startswith("atexit_") and entry.name.endswith(".atexit"):
+                print(entry.path)
 
 print("Temporary files before tests:")
 print_tempfiles()
 test_mkstemp()
 test_write_tempfile()
+test_write_tempfile_bytes()
 print("Temporary files after tests:")
 print_tempfiles()
\ No newline at end of file